@@ -1,7 +1,8 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-from processtable import process_client_table, backup_database, get_db_keys_from_env, get_database_name_from_path, save_and_format_dataframe_to_excel, find_code_matches_in_db, update_old_codes_in_db
+from processtable import process_client_table, backup_database, get_db_keys_from_env, save_and_format_dataframe_to_excel, get_code_map, find_code_matches_in_db, update_old_codes_in_db
 
 
 # Load variables from the .env file
@@ -12,12 +13,19 @@ access_db_0 = os.getenv('ACCESS_DB_PATH_0')
 access_db_1 = os.getenv('ACCESS_DB_PATH_1')
 client_table = os.getenv('CLIENT_TABLE')
 client_key_field = os.getenv('CLIENT_KEY_FIELD')
-db_dir_0 = os.path.dirname(access_db_0)
-db_dir_1 = os.path.dirname(access_db_1)
 
-# Backup database before process
-backup_file_0 = backup_database(access_db_0)
-backup_file_1 = backup_database(access_db_1)
+# Split the database paths once into directory and database name
+db_dir_0, db_file_0 = os.path.split(access_db_0)
+db_dir_1, db_file_1 = os.path.split(access_db_1)
+database_name_0 = os.path.splitext(db_file_0)[0]
+database_name_1 = os.path.splitext(db_file_1)[0]
+
+# Backup both databases in parallel before process
+with ThreadPoolExecutor(max_workers=2) as executor:
+    future_backup_0 = executor.submit(backup_database, access_db_0)
+    future_backup_1 = executor.submit(backup_database, access_db_1)
+    backup_file_0 = future_backup_0.result()
+    backup_file_1 = future_backup_1.result()
 
 # Process client table and obtain mapping codes
 df_mappings = process_client_table(access_db_0, client_table, client_key_field, update_clients=True)
@@ -29,28 +37,41 @@ excel_path = os.path.join(db_dir_0, f'{client_table}_mappings.xlsx')
 # Call the function to save and format the mappings to Excel
 save_and_format_dataframe_to_excel(df_mappings_dict, excel_path)
 
-# Buscar las coincidencias en todas las tablas de la base de datos
-database_name = get_database_name_from_path(access_db_0)
-db_keys = get_db_keys_from_env(database_name)
-df_matches_0 = find_code_matches_in_db(df_mappings, access_db_0, db_keys)
+# Convertir el mapeo de códigos en un diccionario para las búsquedas
+code_map = get_code_map(df_mappings)
+
+# Buscar las coincidencias en todas las tablas de ambas bases de datos en paralelo
+db_keys_0 = get_db_keys_from_env(database_name_0)
+db_keys_1 = get_db_keys_from_env(database_name_1)
+
+with ThreadPoolExecutor(max_workers=2) as executor:
+    future_to_db = {
+        executor.submit(find_code_matches_in_db, code_map, access_db_0, db_keys_0): access_db_0,
+        executor.submit(find_code_matches_in_db, code_map, access_db_1, db_keys_1): access_db_1,
+    }
+    db_matches = {}
+    for future in as_completed(future_to_db):
+        db_matches[future_to_db[future]] = future.result()
+
+df_matches_0 = db_matches[access_db_0]
+df_matches_1 = db_matches[access_db_1]
 
 # # Define the path to save the Excel file in the same directory as the database
-excel_path = os.path.join(db_dir_0, f'{database_name}_mappings.xlsx')
-save_and_format_dataframe_to_excel(df_matches_0, excel_path)
+# (skipped when there are no matches, an Excel file needs at least one sheet)
+if df_matches_0:
+    excel_path = os.path.join(db_dir_0, f'{database_name_0}_mappings.xlsx')
+    save_and_format_dataframe_to_excel(df_matches_0, excel_path)
 
 # Actualizar valores en las tablas con matching
-update_counts_0 = update_old_codes_in_db(df_matches_0, access_db_0, db_keys)
+update_counts_0 = update_old_codes_in_db(df_matches_0, access_db_0)
 print(update_counts_0)
 
-# # Buscar las coincidencias en todas las tablas de la base de datos
-database_name = get_database_name_from_path(access_db_1)
-db_keys = get_db_keys_from_env(database_name)
-df_matches_1 = find_code_matches_in_db(df_mappings, access_db_1, db_keys)
-
 # # Define the path to save the Excel file in the same directory as the database
-excel_path = os.path.join(db_dir_1, f'{database_name}_mappings.xlsx')
-save_and_format_dataframe_to_excel(df_matches_1, excel_path)
+# (skipped when there are no matches, an Excel file needs at least one sheet)
+if df_matches_1:
+    excel_path = os.path.join(db_dir_1, f'{database_name_1}_mappings.xlsx')
+    save_and_format_dataframe_to_excel(df_matches_1, excel_path)
 
 # Actualizar valores en las tablas con matching
-update_counts_1 = update_old_codes_in_db(df_matches_1, access_db_1, db_keys)
+update_counts_1 = update_old_codes_in_db(df_matches_1, access_db_1)
 print(update_counts_1)
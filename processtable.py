@@ -1,15 +1,155 @@
 import shutil
 import os
+import sys
+import ctypes
+import errno
+import importlib.util
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 import sqlalchemy as sa
 import sqlalchemy_access as sa_a
+import pyodbc
 import pandas as pd
-import re
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, colors
+import xlsxwriter
 from dotenv import load_dotenv
 
 
+# Number of rows fetched per round-trip when streaming large tables
+READ_CHUNK_SIZE = 50_000
+
+# Codes ending in an ASCII letter are erroneous. Kept as a string so the same pattern
+# works with both the Python regex engine and pyarrow's RE2 string kernels
+TRAILING_LETTER_PATTERN = r'[A-Za-z]$'
+
+# Up to this many old codes, Access filters the scanned tables with WHERE ... IN (...);
+# beyond it, a single chunked scan of each table is cheaper than many filtered queries
+SQL_FILTER_MAX_CODES = 1_000
+
+# Number of codes bound in each IN (...) list, to stay within Access query limits
+SQL_IN_BATCH_SIZE = 250
+
+# Excel limits for sheet names
+MAX_SHEET_NAME_LENGTH = 31
+INVALID_SHEET_CHARS = str.maketrans('', '', '[]:*?/\\')
+
+# Prefix of the work table where update_old_codes_in_db stages the old and new codes for
+# the join updates; each run appends a random suffix so no existing table is ever reused
+CODE_MAP_TABLE_PREFIX = '_code_map_'
+
+# Fragments of the SQL type names of alphanumeric columns (CHAR also covers VARCHAR, NCHAR...)
+TEXT_TYPES = ('CHAR', 'TEXT')
+
+# pyarrow is optional: when installed, text columns are read as Arrow strings
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# Code page used by the Access ODBC driver for narrow (non-Unicode) text
+ACCESS_ANSI_ENCODING = 'cp1252'
+
+# Maximum number of database engines (and their connection pools) kept alive
+ENGINE_CACHE_SIZE = 8
+
+# Block size for file copies done in Python (shutil defaults to 64 KiB)
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Linux ioctl request that makes a file share the extents of another (copy-on-write clone)
+FICLONE = 0x40049409
+
+# Errors meaning the filesystem cannot clone files, as opposed to a failure of this copy
+_CLONE_UNSUPPORTED_ERRORS = {errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS}
+
+# (source device, destination device) pairs where cloning is known to be unsupported
+_CLONE_UNSUPPORTED_DEVICES = set()
+
+
+def fast_clone(src_path: str, dst_path: str) -> bool:
+    """
+    Tries to create a copy-on-write clone of a file, which completes almost instantly 
+    regardless of the file size because no data is copied.
+
+    Args:
+        src_path (str): The full path to the file to clone.
+        dst_path (str): The full path of the clone. It must not exist yet.
+
+    Returns:
+        bool: True if the clone was created, False if the filesystem does not support 
+              cloning and the file must be copied instead.
+
+    Details:
+        - On Linux, uses the `FICLONE` ioctl (Btrfs, XFS, bcachefs...).
+        - On macOS, calls `clonefile()` (APFS).
+        - When a pair of devices turns out not to support cloning, the result is remembered 
+          and later calls for the same devices return False without trying again.
+    """
+    # Cloning depends on both filesystems, so memoize on the source and destination devices
+    devices = (os.stat(src_path).st_dev, os.stat(os.path.dirname(dst_path) or '.').st_dev)
+    if devices in _CLONE_UNSUPPORTED_DEVICES:
+        return False
+
+    try:
+        if sys.platform.startswith('linux'):
+            import fcntl  # POSIX only
+            with open(src_path, 'rb') as fsrc, open(dst_path, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        elif sys.platform == 'darwin':
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.clonefile(os.fsencode(src_path), os.fsencode(dst_path), 0) != 0:
+                error = ctypes.get_errno()
+                raise OSError(error, os.strerror(error), dst_path)
+        else:
+            _CLONE_UNSUPPORTED_DEVICES.add(devices)
+            return False
+    except OSError as e:
+        if e.errno in _CLONE_UNSUPPORTED_ERRORS:
+            _CLONE_UNSUPPORTED_DEVICES.add(devices)
+        return False
+
+    # Preserve permissions and timestamps
+    shutil.copystat(src_path, dst_path)
+
+    return True
+
+
+def copy_database_file(src_path: str, dst_path: str):
+    """
+    Copies a database file using the fastest copy available on the platform, preserving 
+    its metadata like `shutil.copy2`.
+
+    Args:
+        src_path (str): The full path to the file to copy.
+        dst_path (str): The full path of the copy.
+
+    Raises:
+        OSError: If the file could not be copied.
+
+    Details:
+        - First tries a copy-on-write clone with `fast_clone`.
+        - On Windows, calls `CopyFileExW` so the copy is done by the operating system 
+          instead of a Python read/write loop.
+        - On Linux and macOS, uses `shutil.copyfile`, which relies on zero-copy system calls 
+          (`sendfile` and `fcopyfile`).
+        - Elsewhere, copies the file in blocks of `COPY_BUFFER_SIZE` bytes.
+    """
+    # A clone shares the data blocks, so there is nothing left to copy
+    if fast_clone(src_path, dst_path):
+        return
+
+    if sys.platform == 'win32':
+        if not ctypes.windll.kernel32.CopyFileExW(src_path, dst_path, None, None, None, 0):
+            raise ctypes.WinError()
+    elif sys.platform.startswith('linux') or sys.platform == 'darwin':
+        shutil.copyfile(src_path, dst_path)
+    else:
+        # No zero-copy call here: shutil would use a 64 KiB buffer, so copy in larger blocks
+        with open(src_path, 'rb') as fsrc, open(dst_path, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, length=COPY_BUFFER_SIZE)
+
+    # Preserve permissions and timestamps
+    shutil.copystat(src_path, dst_path)
+
+
 def backup_database(db_path: str, backup_dir: str = None) -> str:
     """
     Creates a backup copy of the Access database file before any modifications are made.
@@ -49,7 +189,7 @@ def backup_database(db_path: str, backup_dir: str = None) -> str:
     backup_path = os.path.join(backup_dir, backup_filename)
     
     # Perform the file copy to create the backup
-    shutil.copy2(db_path, backup_path)
+    copy_database_file(db_path, backup_path)
     
     return backup_path
 
@@ -57,7 +197,8 @@ def backup_database(db_path: str, backup_dir: str = None) -> str:
 def get_dbaccess_connection(db_path: str):
     """
     Establishes a connection to a Microsoft Access database using SQLAlchemy 
-    and returns a connection engine.
+    and returns a connection engine. Engines are cached per database file, so 
+    repeated calls reuse the same connection pool.
 
     Args:
         db_path (str): The full path to the Access database file (.mdb or .accdb).
@@ -71,10 +212,25 @@ def get_dbaccess_connection(db_path: str):
         - Uses the ODBC driver "{Microsoft Access Driver (*.mdb, *.accdb)}" to establish the connection.
         - Configures the connection with the "ExtendedAnsiSQL=1" parameter for better ANSI compatibility.
         - Leverages `sqlalchemy_access` and `pyodbc` for SQLAlchemy integration.
+        - Uses a `QueuePool` with pre-ping so pooled ODBC connections are reused across calls.
+        - Enables pyodbc's `fast_executemany` for executemany batches only when the 
+          `ACCESS_FAST_EXECUTEMANY` environment variable is set to 1, true or yes; 
+          otherwise batches use plain executemany.
+        - Decodes narrow (SQL_CHAR) text as `ACCESS_ANSI_ENCODING` instead of pyodbc's UTF-8 default.
 
     Example:
         engine = get_dbaccess_connection('C:/path/to/your_database.mdb')
     
+    """
+    # Normalize the path so every spelling of the same file shares one cached engine
+    return _create_dbaccess_engine(os.path.abspath(db_path))
+
+
+@lru_cache(maxsize=ENGINE_CACHE_SIZE)
+def _create_dbaccess_engine(db_path: str):
+    """
+    Creates the engine returned by `get_dbaccess_connection`. Results are cached per 
+    absolute database path, keeping at most `ENGINE_CACHE_SIZE` engines.
     """
     # Extract the database name from the db_path
     db_name = os.path.splitext(os.path.basename(db_path))[0]
@@ -93,11 +249,85 @@ def get_dbaccess_connection(db_path: str):
         "access+pyodbc",
         query={"odbc_connect": connection_string}
         )
-    engine = sa.create_engine(connection_url)
+    engine = sa.create_engine(
+        connection_url,
+        poolclass=sa.pool.QueuePool,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True
+        )
+
+    # Opt in to sending executemany batches as parameter arrays instead of one statement per row
+    if os.getenv('ACCESS_FAST_EXECUTEMANY', '').strip().lower() in ('1', 'true', 'yes'):
+        @sa.event.listens_for(engine, 'before_cursor_execute')
+        def enable_fast_executemany(connection, cursor, statement, parameters, context, executemany):
+            if executemany:
+                cursor.fast_executemany = True
+
+    # Decode narrow text with the driver's single-byte code page on every new connection
+    @sa.event.listens_for(engine, 'connect')
+    def set_text_decoding(dbapi_connection, connection_record):
+        dbapi_connection.setdecoding(pyodbc.SQL_CHAR, encoding=ACCESS_ANSI_ENCODING)
 
     return engine
 
 
+def read_table_fast(engine, sql: str, params: list = None) -> pd.DataFrame:
+    """
+    Runs a SELECT query on the raw pyodbc connection behind the engine and returns the 
+    result as a DataFrame, skipping SQLAlchemy's per-row result processing. Intended for 
+    large reads; schema reflection should still go through SQLAlchemy.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): The engine connected to the Access database.
+        sql (str): The SELECT query to run.
+        params (list, optional): Values for the `?` placeholders of the query. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The rows returned by the query, with the query's column names.
+    """
+    raw_connection = engine.raw_connection()
+    try:
+        cursor = raw_connection.cursor()
+        if params:
+            cursor.execute(sql, params)
+        else:
+            cursor.execute(sql)
+        columns = [column[0] for column in cursor.description]
+        return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+    finally:
+        raw_connection.close()  # Return the connection to the pool
+
+
+def read_table_chunks(engine, sql: str, chunksize: int = READ_CHUNK_SIZE):
+    """
+    Runs a SELECT query on the raw pyodbc connection behind the engine, like `read_table_fast`, 
+    but yields the result in DataFrames of at most `chunksize` rows, so large tables never 
+    have to be held in memory at once.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): The engine connected to the Access database.
+        sql (str): The SELECT query to run.
+        chunksize (int, optional): The maximum number of rows per DataFrame. 
+                                   Defaults to READ_CHUNK_SIZE.
+
+    Yields:
+        pd.DataFrame: The next block of rows returned by the query, with the query's column names.
+    """
+    raw_connection = engine.raw_connection()
+    try:
+        cursor = raw_connection.cursor()
+        cursor.execute(sql)
+        columns = [column[0] for column in cursor.description]
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                break
+            yield pd.DataFrame.from_records(rows, columns=columns)
+    finally:
+        raw_connection.close()  # Return the connection to the pool
+
+
 def get_database_name_from_path(db_path: str) -> str:
     """
     Extracts the database name from a full file path.
@@ -131,10 +361,11 @@ def has_trailing_letter(code) -> bool:
         has_trailing_letter("12345A")  # Returns True
         has_trailing_letter("123456")  # Returns False
     """
-    return bool(re.match(r'.*[A-Za-z]$', code))
+    last_char = code[-1:]  # Empty slice for an empty string
+    return last_char.isascii() and last_char.isalpha()
 
 
-def generate_unique_code(old_code, existing_codes) -> str:
+def generate_unique_code(old_code, code_index) -> str:
     """
     Generates a new unique code by removing the last letter from the old code 
     and prefixing it with a number (starting with '9'). If the generated code 
@@ -143,85 +374,188 @@ def generate_unique_code(old_code, existing_codes) -> str:
 
     Args:
         old_code (str): The original code containing a trailing letter.
-        existing_codes (set): A set of codes that are already in use.
+        code_index (dict): The codes already in use, indexed by the code without its 
+                           first character and holding the set of first characters used 
+                           (see `build_code_index`).
 
     Returns:
-        str: A new unique code that is not present in `existing_codes`.
+        str: A new unique code that is not present in `code_index`. The new code is 
+             registered in `code_index`, so it will not be generated again.
 
     Raises:
         ValueError: If a unique code could not be generated after trying all prefixes.
 
     Example:
-        generate_unique_code("12345A", {"912345", "812345"})  # Returns a unique code like "712345"
+        generate_unique_code("12345A", {"12345": {"9", "8"}})  # Returns a unique code like "712345"
     """
-    base_code = old_code[:-1]  # Remove the trailing letter
-    for prefix in ['9', '8', '7', '6', '5', '4', '3', '2', '1', '0']:
-        new_code = prefix + base_code
-        if new_code not in existing_codes:
-            return new_code
-    raise ValueError("Could not generate a unique code")
+    return generate_unique_codes([old_code], code_index)[0]
 
 
-def format_header_cell(cell, font_size=11):
+def generate_unique_codes(old_codes, code_index) -> list:
     """
-    Formats a header cell with the default styling: white bold text and green background.
+    Generates a new unique code for each old code in a single pass, removing the trailing 
+    letter and prefixing the first free number from '9' down to '0'. Each new code is 
+    registered in `code_index` as soon as it is generated, so old codes sharing the same 
+    base code get different prefixes.
+
+    Args:
+        old_codes (iterable): The original codes containing a trailing letter.
+        code_index (dict): The codes already in use, as returned by `build_code_index`. 
+                           It is updated in place with the new codes.
+
+    Returns:
+        list: The new codes, in the same order as `old_codes`.
+
+    Raises:
+        ValueError: If a unique code could not be generated for one of the old codes.
+
+    Example:
+        generate_unique_codes(["12345A", "12345B"], {"12345": {"9"}})  # Returns ["812345", "712345"]
+    """
+    new_codes = []
+    for old_code in old_codes:
+        base_code = old_code[:-1]  # Remove the trailing letter
+
+        # A single lookup serves both to check the prefixes and to register the new one
+        used_prefixes = code_index.get(base_code)
+        if used_prefixes is None:
+            used_prefixes = code_index[base_code] = set()
+
+        for prefix in '9876543210':
+            if prefix not in used_prefixes:
+                break
+        else:
+            raise ValueError("Could not generate a unique code")
+
+        used_prefixes.add(prefix)
+        new_codes.append(prefix + base_code)
+
+    return new_codes
+
+
+def build_code_index(codes) -> defaultdict:
+    """
+    Indexes a collection of codes by the code without its first character, so the 
+    prefixes already taken for a given base code can be looked up in a single step.
+
+    Args:
+        codes (iterable): The codes already in use. Values that are not strings are ignored.
+
+    Returns:
+        defaultdict: A dictionary mapping each base code to the set of first characters in use.
+
+    Example:
+        build_code_index({"912345", "812345", "54321"})  # {"12345": {"9", "8"}, "4321": {"5"}}
+    """
+    code_index = defaultdict(set)
+    for code in codes:
+        if isinstance(code, str):
+            code_index[code[1:]].add(code[:1])
+    return code_index
+
+
+def get_header_format(workbook, font_size=11):
+    """
+    Creates the default header cell format: white bold text and green background.
 
     Parameters:
     -----------
-    cell : openpyxl.cell.cell.Cell
-        The cell to format.
+    workbook : xlsxwriter.workbook.Workbook
+        The workbook where the format is registered.
     
     font_size : int, optional
         The font size to be applied to the header cell. Default is 11.
 
     Returns:
     --------
-    None
+    xlsxwriter.format.Format
+        The format to apply to the header cells.
     """
-    cell.font = Font(color="FFFFFF", bold=True, size=font_size + 1)
-    cell.fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+    return workbook.add_format({
+        'font_color': '#FFFFFF',
+        'bold': True,
+        'font_size': font_size + 1,
+        'bg_color': '#70AD47',
+        'pattern': 1,
+    })
 
 
-def adjust_column_widths(sheet,  max_width=80):
+def adjust_column_widths(sheet, df, max_width=80, first_col=0):
     """
     Adjusts the width of each column in the Excel sheet based on the maximum width of the data and header values.
 
     Parameters:
     -----------
-    sheet : openpyxl.worksheet.worksheet.Worksheet
+    sheet : xlsxwriter.worksheet.Worksheet
         The worksheet where column widths need to be adjusted.
 
+    df : pd.DataFrame
+        The DataFrame written to the worksheet, used to measure the header and data values.
+
     max_width : int, optional (default=80)
         The maximum allowed width for any column. If the calculated width exceeds this value,
         the column width will be set to this maximum value.
+
+    first_col : int, optional (default=0)
+        The worksheet column where the first DataFrame column is written.
     
     Returns:
     --------
     None
     """
-    for col in sheet.columns:
-        max_length = 0
-        column = col[0].column_letter  # Get the column name
-
+    for col_num, col_name in enumerate(df.columns):
         # Calculate the width required by the header (considering formatting)
-        header_length = len(str(col[0].value))
+        header_length = len(str(col_name))
         adjusted_header_length = header_length * 1.5  # Factor to account for bold and larger font size
 
-        # Compare the header length with the lengths of the data values
-        for cell in col:
-            try:
-                cell_length = len(str(cell.value))
-                if cell_length > max_length:
-                    max_length = cell_length
-            except:
-                pass
+        # Measure all the data values of the column in a single vectorized pass,
+        # skipping missing values since they are written as blank cells
+        lengths = df.iloc[:, col_num].dropna().astype(str).str.len()
+        max_length = lengths.max() if not lengths.empty else 0
         
         # Use the greater of the header length or data length for column width
         max_length = max(max_length, adjusted_header_length)
 
         # Adjust the column width and apply the max_width limit
         adjusted_width = min(max_length + 3, max_width)
-        sheet.column_dimensions[column].width = adjusted_width
+        sheet.set_column(first_col + col_num, first_col + col_num, adjusted_width)
+
+
+def get_sheet_names(titles) -> dict:
+    """
+    Maps each title to a valid and unique Excel sheet name: at most 31 characters, without 
+    the characters []:*?/\\ and not starting or ending with an apostrophe. Names that collide 
+    (Excel compares them case-insensitively) get a numeric suffix.
+
+    Args:
+        titles (iterable): The requested sheet titles, e.g. table names.
+
+    Returns:
+        dict: A dictionary where keys are the titles and values are the sheet names to use.
+
+    Example:
+        get_sheet_names(["Clients", "A/B"])  # {"Clients": "Clients", "A/B": "AB"}
+    """
+    sheet_names = {}
+    used_names = set()
+
+    for title in titles:
+        # Remove the invalid characters and truncate to the Excel limit before stripping
+        # the apostrophes, so truncation cannot leave one at the end of the name
+        base_name = str(title).translate(INVALID_SHEET_CHARS)[:MAX_SHEET_NAME_LENGTH].strip("'") or 'Sheet'
+
+        # Add a numeric suffix until the name is unique
+        sheet_name = base_name
+        suffix = 1
+        while sheet_name.lower() in used_names:
+            suffix += 1
+            tag = f"~{suffix}"
+            sheet_name = (base_name[:MAX_SHEET_NAME_LENGTH - len(tag)] + tag).strip("'")
+
+        used_names.add(sheet_name.lower())
+        sheet_names[title] = sheet_name
+
+    return sheet_names
 
 
 def save_and_format_dataframe_to_excel(dfs_dict: dict, excel_path: str):
@@ -229,35 +563,54 @@ def save_and_format_dataframe_to_excel(dfs_dict: dict, excel_path: str):
     Saves a dictionary of DataFrames to an Excel file, with each DataFrame saved on a separate sheet.
     Formats the headers, adjusts column widths, and applies filters to all columns for each sheet.
 
+    The workbook is written with xlsxwriter in `constant_memory` mode: rows are written in order 
+    and flushed to disk as they go, so memory use does not grow with the size of the sheets.
+
+    Titles that are not valid Excel sheet names (e.g. Access table names longer than 31 
+    characters) are shortened with `get_sheet_names`; those sheets get a first TABLE_NAME 
+    column holding the full title.
+
     Args:
         dfs_dict (dict): A dictionary where keys are sheet names and values are DataFrames to be saved.
         excel_path (str): The file path where the Excel file will be saved.
     """
-    # Create a new Excel writer object
-    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
+    # Valid, unique sheet name for each title
+    sheet_names = get_sheet_names(dfs_dict.keys())
+
+    # Create a new workbook that streams each row to disk once it is written
+    workbook = xlsxwriter.Workbook(excel_path, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+    })
+    header_format = get_header_format(workbook)
+
+    try:
         for sheet_title, df in dfs_dict.items():
-            # Write each DataFrame to a separate sheet
-            df.to_excel(writer, index=False, sheet_name=sheet_title)
-    
-    # Load the workbook to apply formatting
-    wb = load_workbook(excel_path)
-    
-    # Loop through each sheet in the workbook
-    for sheet_title in dfs_dict.keys():
-        sheet = wb[sheet_title]  # Access the sheet by name
-        
-        # Format header cells for all columns
-        for col_num in range(1, dfs_dict[sheet_title].shape[1] + 1):  # Loop over the number of columns
-            format_header_cell(sheet.cell(row=1, column=col_num))  # Apply header formatting
+            sheet_name = sheet_names[sheet_title]
+            sheet = workbook.add_worksheet(sheet_name)
 
-        # Call the adjust_column_widths function to format the sheet
-        adjust_column_widths(sheet)
+            # Keep the full title visible in a first column when the sheet name had to change
+            title_cells = [sheet_title] if sheet_name != sheet_title else []
+            first_col = len(title_cells)
+            if title_cells:
+                adjust_column_widths(sheet, pd.DataFrame({'TABLE_NAME': title_cells}))
 
-        # Apply a filter to all columns
-        sheet.auto_filter.ref = sheet.dimensions
+            # Call the adjust_column_widths function to format the sheet
+            adjust_column_widths(sheet, df, first_col=first_col)
 
-    # Save the formatted Excel file
-    wb.save(excel_path)
+            # Write the header cells for all columns with the header formatting
+            header = ['TABLE_NAME'] * first_col + [str(col_name) for col_name in df.columns]
+            sheet.write_row(0, 0, header, header_format)
+
+            # Write the data rows in order (required by constant_memory), missing values as blank cells
+            for row_num, row in enumerate(df.itertuples(index=False, name=None), start=1):
+                sheet.write_row(row_num, 0, title_cells + [None if pd.isna(value) else value for value in row])
+
+            # Apply a filter to all columns
+            if len(header) > 0:
+                sheet.autofilter(0, 0, df.shape[0], len(header) - 1)
+    finally:
+        workbook.close()
 
 
 def get_db_keys_from_env(database_name: str):
@@ -293,23 +646,179 @@ def get_db_keys_from_env(database_name: str):
     return db_keys
 
 
-def find_code_matches_in_db(df_mappings: pd.DataFrame, db_path: str, db_keys: dict) -> dict:
+def get_code_map(df_mappings: pd.DataFrame) -> dict:
+    """
+    Converts the mapping of old and new codes into a dictionary, so old codes can be looked 
+    up directly instead of filtering the DataFrame for each one.
+
+    Args:
+        df_mappings (pd.DataFrame): A DataFrame with OLD_CODE and NEW_CODE columns.
+
+    Returns:
+        dict: A dictionary where keys are old codes and values are the corresponding new codes.
+              Empty if `df_mappings` is None.
+    """
+    if df_mappings is None:
+        return {}
+
+    return dict(zip(df_mappings['OLD_CODE'].tolist(), df_mappings['NEW_CODE'].tolist()))
+
+
+def get_code_columns(inspector, table_name: str) -> tuple:
+    """
+    Returns the alphanumeric fields of a table with a length between 6 and 20 characters, 
+    i.e. the fields that can hold a client code. Reflection results are cached by the 
+    inspector itself, so reusing one inspector reflects each table schema only once.
+
+    Args:
+        inspector (sqlalchemy.engine.reflection.Inspector): The inspector of the Access database.
+        table_name (str): The name of the table to inspect.
+
+    Returns:
+        tuple: The names of the matching fields, in table order.
+    """
+    # Get the columns of the table
+    columns = inspector.get_columns(table_name)
+
+    # List to store the columns that match the criteria
+    matching_columns = []
+
+    # Loop through each column to find alphanumeric fields with length between 6 and 20
+    for column in columns:
+        col_type = str(column['type']).upper()
+
+        # Check if the column is of alphanumeric type and has the correct length
+        if any(text_type in col_type for text_type in TEXT_TYPES):
+            col_length = column['type'].length  # Get the column length
+
+            if col_length and 6 <= col_length <= 20:
+                matching_columns.append(column['name'])
+
+    return tuple(matching_columns)
+
+
+def match_codes_in_frame(df: pd.DataFrame, columns: list, code_series: pd.Series) -> list:
+    """
+    Looks up the old codes in the given columns of a DataFrame, one hashed pass per column.
+
+    Args:
+        df (pd.DataFrame): The rows read from the table.
+        columns (list): The columns where the old codes are searched.
+        code_series (pd.Series): The new codes, indexed by old code.
+
+    Returns:
+        list: One DataFrame per column with matches, holding the matching rows plus the 
+              FOUND_VALUE, FOUND_FIELD and NEW_VALUE columns.
+    """
+    frames = []
+
+    # Loop through each column and look up all the old codes in a single pass
+    for col_name in columns:
+        values = df[col_name]
+        mask = values.isin(code_series.index)
+
+        # If matches are found, add them to the list
+        if mask.any():
+            found_values = values[mask]
+
+            # Create a copy to avoid SettingWithCopyWarning
+            df_code_matches = df[mask].copy()
+            df_code_matches['FOUND_VALUE'] = found_values                   # Store the old code found
+            df_code_matches['FOUND_FIELD'] = col_name                       # Store the column where the match was found
+            df_code_matches['NEW_VALUE'] = found_values.map(code_series)    # Store the new code for the update
+            frames.append(df_code_matches)
+
+    return frames
+
+
+def find_code_matches_in_table(engine, table_name: str, key_columns: list, matching_columns: list, 
+                               code_map: dict) -> pd.DataFrame:
+    """
+    Search the given alphanumeric fields of a single table for old client codes that need to be 
+    replaced. An empty table simply returns no rows, so no separate row count is queried.
+
+    When there are at most `SQL_FILTER_MAX_CODES` old codes, Access filters each field with 
+    `WHERE field IN (...)` (in batches of `SQL_IN_BATCH_SIZE` codes), so only the matching rows 
+    are transferred. With more codes, the table is streamed once in chunks and filtered locally.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): The engine connected to the Access database.
+        table_name (str): The name of the table to scan.
+        key_columns (list): The key fields of the table, returned with every match.
+        matching_columns (list): The alphanumeric fields where the old codes are searched.
+        code_map (dict): A dictionary mapping each old code to its new code.
+
+    Returns:
+        pd.DataFrame: The matches found, with the key fields, the matched fields, FOUND_VALUE, 
+                      FOUND_FIELD and NEW_VALUE columns. Empty if nothing was found or the 
+                      table could not be read.
+    """
+    # Construct the SQL query
+    select_columns = ', '.join(f"[{col}]" for col in [*key_columns, *matching_columns])
+    query = f"SELECT {select_columns} FROM [{table_name}]"
+
+    # Hashed lookup of the new code for each old code, shared by all the columns
+    code_series = pd.Series(code_map, dtype=object)
+
+    # Matches found in each read and column, concatenated once at the end
+    frames = []
+
+    try:
+        if len(code_map) <= SQL_FILTER_MAX_CODES:
+            old_codes = list(code_map)
+
+            # Let Access filter each field so only the matching rows cross the ODBC boundary
+            for col_name in matching_columns:
+                for start in range(0, len(old_codes), SQL_IN_BATCH_SIZE):
+                    codes_batch = old_codes[start:start + SQL_IN_BATCH_SIZE]
+                    placeholders = ', '.join('?' * len(codes_batch))
+                    query_filtered = f"{query} WHERE [{col_name}] IN ({placeholders})"
+                    df_rows = read_table_fast(engine, query_filtered, codes_batch)
+
+                    # Access compares text case-insensitively, so keep only the exact matches
+                    frames.extend(match_codes_in_frame(df_rows, [col_name], code_series))
+        else:
+            # Stream the table in chunks so memory stays bounded regardless of the table size
+            for df_chunk in read_table_chunks(engine, query):
+                frames.extend(match_codes_in_frame(df_chunk, matching_columns, code_series))
+    except Exception as e:
+        print(f"Error retrieving records from {table_name}: {e}")
+        return pd.DataFrame()
+
+    # Nothing found in any column
+    if not frames:
+        return pd.DataFrame()
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def find_code_matches_in_db(code_map: dict, db_path: str, db_keys: dict, max_workers: int = 8) -> dict:
     """
     Search all alphanumeric fields in all non-empty tables in the database for old client codes 
     that need to be replaced. The fields must have a length between 6 and 20 characters. Matches 
     are returned for each table as a DataFrame containing the key columns and the columns where 
     the match was found. Also adds columns for FOUND_FIELD and NEW_VALUE to prepare for updates.
 
+    The table schemas are inspected sequentially, and the tables are then scanned concurrently 
+    in a thread pool, each thread using its own pooled connection.
+
     Args:
-        df_mappings (pd.DataFrame): A DataFrame containing the old and new codes.
+        code_map (dict): A dictionary mapping each old code to its new code, as returned by 
+                         `get_code_map`.
         db_path (str): Path to the Access database.
         db_keys (dict): Dictionary containing key fields for each table.
+        max_workers (int, optional): The maximum number of tables scanned at the same time. 
+                                     Defaults to 8.
     
     Returns:
         dict: A dictionary where keys are table names, and values are DataFrames with the matches.
               Each DataFrame contains the key fields (if available), the column where the match 
               was found, the matched value, and the corresponding new value.
     """
+    # Nothing to search for if there are no old codes
+    if not code_map:
+        return {}
+
     # Connect to the database
     engine = get_dbaccess_connection(db_path)
 
@@ -320,88 +829,47 @@ def find_code_matches_in_db(df_mappings: pd.DataFrame, db_path: str, db_keys: di
     inspector = sa.inspect(engine)
     tables = inspector.get_table_names()
 
+    # Columns to scan for each table, in database order
+    table_columns = {}
+
     # Loop through each table in the database
     for table_name in tables:
-        # Check if the table has any records by querying the count of rows
-        query_count = f"SELECT COUNT(*) AS countregs FROM {table_name}"
-        try:
-            result = pd.read_sql(query_count, engine)
-            if result['countregs'][0] == 0:
-                # If the table is empty, skip to the next table
-                continue
-        except Exception as e:
-            print(f"Error counting rows in {table_name}: {e}")
-            continue
-        
-        # Get the columns of the current table
-        columns = inspector.get_columns(table_name)
-        
-        # List to store the columns that match the criteria
-        matching_columns = []
-
-        # Loop through each column to find alphanumeric fields with length between 6 and 20
-        for column in columns:
-            col_name = column['name']
-            col_type = str(column['type']).upper()
+        # Retrieve the key columns for the table from db_keys
+        key_columns = db_keys.get(table_name, [])
 
-            # Check if the column is of alphanumeric type and has the correct length
-            if ('CHAR' in col_type or 'TEXT' in col_type or 'VARCHAR' in col_type):
-                col_length = column['type'].length  # Get the column length
+        # Tables without key fields cannot be updated, so skip them
+        if not key_columns:
+            continue
 
-                if col_length and 6 <= col_length <= 20:
-                    matching_columns.append(col_name)
+        # Get the alphanumeric columns of the current table that can hold a code,
+        # removing key columns from them to avoid duplicates
+        matching_columns = [col for col in get_code_columns(inspector, table_name) if col not in key_columns]
 
         # If no columns match the criteria, skip the table
         if not matching_columns:
             continue
 
-        # Retrieve the key columns for the table from db_keys
-        key_columns = db_keys.get(table_name, [])
+        table_columns[table_name] = (key_columns, matching_columns)
 
-        # Remove key columns from matching_columns to avoid duplicates
-        matching_columns = [col for col in matching_columns if col not in key_columns]
+    # Scan the tables concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            table_name: executor.submit(find_code_matches_in_table, engine, table_name, 
+                                        key_columns, matching_columns, code_map)
+            for table_name, (key_columns, matching_columns) in table_columns.items()
+        }
 
-        # Construct the SQL query
-        if key_columns:
-            key_columns_str = ', '.join(key_columns)
-            query = f"SELECT {key_columns_str}, {', '.join(matching_columns)} FROM {table_name}"
-        else:
-            continue
-        
-        try:
-            df_table = pd.read_sql(query, engine)
-        except Exception as e:
-            print(f"Error retrieving records from {table_name}: {e}")
-            continue
-
-        # Initialize an empty DataFrame to store matches for this table
-        df_table_matches = pd.DataFrame()
-
-        # Loop through the old codes and check if they exist in any of the matching columns
-        for old_code in df_mappings['OLD_CODE']:
-            # Get the corresponding new code for the old code from df_mappings
-            new_code = df_mappings.loc[df_mappings['OLD_CODE'] == old_code, 'NEW_CODE'].values[0]
-
-            # Loop through each matching column and check for the old code
-            for col_name in matching_columns:
-                # Create a copy to avoid SettingWithCopyWarning
-                df_code_matches = df_table[df_table[col_name] == old_code].copy()
+        # Collect the results in table order so the output is deterministic
+        for table_name, future in futures.items():
+            df_table_matches = future.result()
 
-                # If matches are found, add them to the DataFrame for this table
-                if not df_code_matches.empty:
-                    df_code_matches.loc[:, 'FOUND_VALUE'] = old_code  # Store the old code found
-                    df_code_matches.loc[:, 'FOUND_FIELD'] = col_name  # Store the column where the match was found
-                    df_code_matches.loc[:, 'NEW_VALUE'] = new_code    # Store the new code for the update
-                    df_table_matches = pd.concat([df_table_matches, df_code_matches], ignore_index=True)
-
-        # If matches were found, add the DataFrame to the dictionary
-        if not df_table_matches.empty:
-            matches_dict[table_name] = df_table_matches
+            # If matches were found, add the DataFrame to the dictionary
+            if not df_table_matches.empty:
+                matches_dict[table_name] = df_table_matches
 
     return matches_dict
 
 
-
 def process_client_table(db_path: str, client_table: str, client_key_field: str, update_clients: bool = True):
     """
     Process the client table to identify erroneous client codes, generate new unique codes, 
@@ -425,124 +893,167 @@ def process_client_table(db_path: str, client_table: str, client_key_field: str,
     
     engine = get_dbaccess_connection(db_path)
     
-    # Query to load the client data from the database
-    query = f"SELECT * FROM {client_table}"
-    df_clients = pd.read_sql(query, engine)
+    # Query to load only the client codes from the database
+    query = f"SELECT [{client_key_field}] FROM [{client_table}]"
+
+    existing_codes = set()  # Set of existing codes
+    old_codes = []          # Erroneous codes, in table order
+
+    # Arrow-backed strings make the vectorized string checks run in native code
+    read_options = {'dtype_backend': 'pyarrow'} if _HAS_PYARROW else {}
 
-    # Filter erroneous codes that have a trailing letter
-    df_clients['Has_Letter'] = df_clients[client_key_field].apply(has_trailing_letter)
-    df_erroneous = df_clients[df_clients['Has_Letter'] == True]
+    # Stream the table in chunks so only one block of codes is held in memory at a time
+    for df_chunk in pd.read_sql(query, engine, chunksize=READ_CHUNK_SIZE, **read_options):
+        codes = df_chunk[client_key_field]
+        existing_codes.update(codes.to_numpy(copy=False).tolist())
 
-    # Create the mapping table for old and new codes
-    df_mappings = pd.DataFrame(columns=['OLD_CODE', 'NEW_CODE'])
+        # Keep only the erroneous codes that have a trailing letter
+        mask = codes.str.contains(TRAILING_LETTER_PATTERN, regex=True, na=False)
+        old_codes.extend(codes[mask].to_numpy().tolist())
 
-    existing_codes = set(df_clients[client_key_field])  # Set of existing codes
+    # Index the existing codes by base code once, before generating the new ones
+    code_index = build_code_index(existing_codes)
 
     # Generate new codes
-    for idx, row in df_erroneous.iterrows():
-        old_code = row[client_key_field]
-        new_code = generate_unique_code(old_code, existing_codes)
-        existing_codes.add(new_code)  # Add new code to the existing set
-
-        # Add old and new code to the mappings DataFrame
-        new_row = pd.DataFrame([{'OLD_CODE': old_code, 'NEW_CODE': new_code}])
-        df_mappings = pd.concat([df_mappings, new_row], ignore_index=True)
-        
+    new_codes = generate_unique_codes(old_codes, code_index)
+
+    # Create the mapping table for old and new codes in a single step
+    df_mappings = pd.DataFrame({'OLD_CODE': old_codes, 'NEW_CODE': new_codes})
+
     # Conditionally update the client table in the database
-    if update_clients:
+    if update_clients and not df_mappings.empty:
+        # SQL query to update the records directly; Access compares text case-insensitively,
+        # so StrComp in binary mode restricts each statement to the exact old code
+        query = sa.text(f"""
+            UPDATE [{client_table}]
+            SET [{client_key_field}] = :new_code
+            WHERE [{client_key_field}] = :old_code
+            AND StrComp([{client_key_field}], :old_code, 0) = 0
+        """)
+
+        # One parameter set per mapping, taken straight from the code lists
+        params_list = [
+            {'new_code': new_code, 'old_code': old_code}
+            for old_code, new_code in zip(old_codes, new_codes)
+        ]
+
+        # Send all the updates as a single executemany batch
         with engine.begin() as connection:
-            for idx, row in df_mappings.iterrows():
-                old_code = row['OLD_CODE']
-                new_code = row['NEW_CODE']
-                
-                # SQL query to update the records directly
-                query = sa.text(f"""
-                    UPDATE {client_table}
-                    SET {client_key_field} = :new_code
-                    WHERE {client_key_field} = :old_code
-                """)
-                connection.execute(query, {'new_code': new_code, 'old_code': old_code})
+            connection.execute(query, params_list)
 
     return df_mappings
 
 
-def update_old_codes_in_db(matches_dict: dict, db_path: str, db_keys: dict) -> dict:
+def update_old_codes_in_db(matches_dict: dict, db_path: str) -> dict:
     """
     Updates the OLD_CODE values in the database tables with their corresponding NEW_CODE values 
     based on the matches found in the find_code_matches_in_db function. It also counts how many 
     records were updated for each table. All updates are handled within a transaction.
 
+    The pairs of old and new codes are staged once in a work table named `CODE_MAP_TABLE_PREFIX` 
+    plus a random suffix, created for this run only. Each table and field where codes were found 
+    is then updated with a single `UPDATE ... INNER JOIN` statement, so Access performs the 
+    substitution internally. The work table is dropped at the end; no other table is ever dropped.
+
+    Records are matched on the found value, so the table key fields are not needed here: they 
+    are only used by find_code_matches_in_db to select the tables to scan.
+
     Args:
         matches_dict (dict): Dictionary where keys are table names, and values are DataFrames 
-                             with matches. The DataFrames must contain the key columns, 
-                             FOUND_FIELD, FOUND_VALUE, and NEW_VALUE columns.
+                             with matches. The DataFrames must contain the FOUND_FIELD, 
+                             FOUND_VALUE, and NEW_VALUE columns.
         db_path (str): Path to the Access database.
-        db_keys (dict): Dictionary containing key fields for each table.
 
     Returns:
         dict: A dictionary where keys are table names and values are the count of updated records.
+
+    Raises:
+        Exception: Any error while staging the codes or updating a table is printed and re-raised 
+                   after the transaction has been rolled back, so no counts are returned for 
+                   updates that were not committed.
     """
+    # Nothing to update if no matches were found
+    if not matches_dict:
+        return {}
+
     # Connect to the database
     engine = get_dbaccess_connection(db_path)
+    quote = engine.dialect.identifier_preparer.quote
 
     # Dictionary to store the number of updated records for each table
     update_counts = {}
 
-    # Begin a transaction
-    with engine.begin() as connection:
-        try:
+    # Unique pairs of old and new codes found across all the tables
+    df_code_map = (
+        pd.concat([df_matches[['FOUND_VALUE', 'NEW_VALUE']] for df_matches in matches_dict.values()])
+        .drop_duplicates()
+        )
+    params_list = [
+        {'old_code': old_code, 'new_code': new_code}
+        for old_code, new_code in zip(df_code_map['FOUND_VALUE'].tolist(), df_code_map['NEW_VALUE'].tolist())
+    ]
+
+    # Work table name unique to this run
+    code_map_name = f"{CODE_MAP_TABLE_PREFIX}{uuid.uuid4().hex[:16]}"
+    code_map_table = quote(code_map_name)
+    code_map_created = False
+
+    try:
+        # Stage the code pairs in the work table, refusing to touch a table that already exists
+        with engine.begin() as connection:
+            if sa.inspect(connection).has_table(code_map_name):
+                raise RuntimeError(f"The work table {code_map_name} already exists in {db_path}")
+            connection.execute(sa.text(
+                f"CREATE TABLE {code_map_table} (old_code TEXT(255), new_code TEXT(255))"
+                ))
+            code_map_created = True
+            connection.execute(
+                sa.text(f"INSERT INTO {code_map_table} (old_code, new_code) VALUES (:old_code, :new_code)"),
+                params_list
+                )
+
+        # Begin a transaction, rolled back automatically if any update fails
+        with engine.begin() as connection:
             # Loop through each table in the matches_dict
             for table_name, df_matches in matches_dict.items():
-                # Get the key columns for the current table
-                key_columns = db_keys.get(table_name, [])
+                table = quote(table_name)
 
                 # Initialize the count for this table
                 update_counts[table_name] = 0
 
-                # Loop through each row in the DataFrame to build the UPDATE query
-                for idx, row in df_matches.iterrows():
-                    found_value = row['FOUND_VALUE']
-                    new_value = row['NEW_VALUE']
-                    found_field = row['FOUND_FIELD']
-
-                    # Build the WHERE clause using the key columns
-                    where_clauses = []
-                    for key_col in key_columns:
-                        key_value = row[key_col]
-                        where_clauses.append(f"{key_col} = :{key_col}")
+                # Build one UPDATE query for each field where old codes were found
+                for found_field in df_matches['FOUND_FIELD'].unique():
+                    field = f"{table}.{quote(found_field)}"
 
-                    # Join the WHERE clauses
-                    where_clause = " AND ".join(where_clauses)
-
-                    # Build the UPDATE query
+                    # Access joins text case-insensitively, so StrComp(..., 0) keeps exact matches only
                     update_query = sa.text(f"""
-                    UPDATE {table_name}
-                    SET {found_field} = :new_value
-                    WHERE {found_field} = :found_value AND {where_clause}
+                    UPDATE {table} INNER JOIN {code_map_table}
+                    ON {field} = {code_map_table}.old_code
+                    SET {field} = {code_map_table}.new_code
+                    WHERE StrComp({field}, {code_map_table}.old_code, 0) = 0
                     """)
 
-                    # print(f"Executing query: {update_query}")
-
-                    # Prepare the parameter dictionary for the query
-                    params = {'new_value': new_value, 'found_value': found_value}
-                    for key_col in key_columns:
-                        params[key_col] = row[key_col]
-
                     # Execute the UPDATE query and count successful updates
                     try:
-                        result = connection.execute(update_query, params)
-                        rows_updated = result.rowcount  # Get the number of rows affected
-                        update_counts[table_name] += rows_updated  # Add to the counter
+                        result = connection.execute(update_query)
+                        update_counts[table_name] += result.rowcount  # Add to the counter
                     except Exception as e:
                         print(f"Error updating {table_name}: {e}")
                         raise  # Re-raise the exception to ensure the transaction is rolled back
 
-        except Exception as e:
-            print(f"Transaction failed: {e}")
-            # Transaction will automatically roll back if any exception occurs
-
-    return update_counts
-
-
+    except Exception as e:
+        # Nothing was committed, so the partial counts must not be reported as applied
+        print(f"Transaction failed: {e}")
+        raise
 
+    finally:
+        # Remove the work table, only if this run created it
+        if code_map_created:
+            try:
+                with engine.begin() as connection:
+                    if sa.inspect(connection).has_table(code_map_name):
+                        connection.execute(sa.text(f"DROP TABLE {code_map_table}"))
+            except Exception as e:
+                print(f"Error dropping {code_map_name}: {e}")
 
+    return update_counts